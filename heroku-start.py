@@ -5,72 +5,19 @@ Creates config from environment variables and starts the application
 """
 
 import os
-import json
 import sys
-import subprocess
+from concurrent import futures
 
+from startup_config import (
+    DEFAULT_TICKET_URL,
+    create_config_from_env,
+    write_config_if_changed,
+    build_monitor_command,
+)
 
-def create_config_from_env():
-    """Create config.json from environment variables"""
-    config = {}
 
-    # Telegram configuration
-    if os.getenv("TELEGRAM_BOT_TOKEN") and os.getenv("TELEGRAM_CHAT_ID"):
-        telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-
-        # Handle multiple chat IDs (comma-separated)
-        if "," in telegram_chat_id:
-            chat_ids = [id.strip() for id in telegram_chat_id.split(",")]
-        else:
-            chat_ids = telegram_chat_id.strip()
-
-        config["telegram"] = {
-            "bot_token": os.getenv("TELEGRAM_BOT_TOKEN"),
-            "chat_id": chat_ids,
-        }
-
-    # Email configuration (optional)
-    if all(
-        [
-            os.getenv("EMAIL_SMTP_SERVER"),
-            os.getenv("EMAIL_USERNAME"),
-            os.getenv("EMAIL_PASSWORD"),
-            os.getenv("EMAIL_TO"),
-        ]
-    ):
-        config["email"] = {
-            "smtp_server": os.getenv("EMAIL_SMTP_SERVER", "smtp.gmail.com"),
-            "smtp_port": int(os.getenv("EMAIL_SMTP_PORT", "587")),
-            "username": os.getenv("EMAIL_USERNAME"),
-            "password": os.getenv("EMAIL_PASSWORD"),
-            "from_email": os.getenv("EMAIL_FROM", os.getenv("EMAIL_USERNAME")),
-            "to_email": os.getenv("EMAIL_TO"),
-        }
-
-    # SMS configuration (optional)
-    if all(
-        [
-            os.getenv("TWILIO_ACCOUNT_SID"),
-            os.getenv("TWILIO_AUTH_TOKEN"),
-            os.getenv("TWILIO_FROM_NUMBER"),
-            os.getenv("TWILIO_TO_NUMBER"),
-        ]
-    ):
-        config["sms"] = {
-            "account_sid": os.getenv("TWILIO_ACCOUNT_SID"),
-            "auth_token": os.getenv("TWILIO_AUTH_TOKEN"),
-            "from_number": os.getenv("TWILIO_FROM_NUMBER"),
-            "to_number": os.getenv("TWILIO_TO_NUMBER"),
-        }
-
-    # Pushover configuration (optional)
-    if all([os.getenv("PUSHOVER_APP_TOKEN"), os.getenv("PUSHOVER_USER_KEY")]):
-        config["pushover"] = {
-            "app_token": os.getenv("PUSHOVER_APP_TOKEN"),
-            "user_key": os.getenv("PUSHOVER_USER_KEY"),
-        }
-
-    return config
+# How long the boot-time configuration test may take, in seconds
+CONFIG_TEST_TIMEOUT = 30
 
 
 def main():
@@ -84,67 +31,51 @@ def main():
         print("Please set at least TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID")
         sys.exit(1)
 
-    # Write config file
-    with open("config.json", "w") as f:
-        json.dump(config, f, indent=2)
+    # Write config file (skipped when unchanged across restarts)
+    if write_config_if_changed(config):
+        print("✅ Config file created from environment variables")
+    else:
+        print("✅ Config file unchanged, reusing existing config.json")
 
-    print("✅ Config file created from environment variables")
-
-    # Test configuration
+    # Test configuration in-process instead of spawning another interpreter
     print("🔍 Testing configuration...")
+    checker = None
+    # Not used as a context manager: leaving the with-block would wait for a
+    # hung test, which is exactly what the timeout is there to avoid
+    executor = futures.ThreadPoolExecutor(max_workers=1)
     try:
-        result = subprocess.run(
-            [
-                "python",
-                "ticket_checker.py",
-                "--test-telegram",
-                "--config",
-                "config.json",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        from ticket_checker import SportstimingTicketChecker
+
+        checker = SportstimingTicketChecker(
+            event_url=os.getenv("TICKET_URL", DEFAULT_TICKET_URL),
+            config_file="config.json",
         )
 
-        if result.returncode == 0:
+        test = executor.submit(checker.test_telegram_notification)
+        if test.result(timeout=CONFIG_TEST_TIMEOUT):
             print("✅ Configuration test passed")
         else:
             print("⚠️ Configuration test failed, but continuing...")
-            print(f"Error: {result.stderr}")
-    except subprocess.TimeoutExpired:
-        print("⚠️ Configuration test timed out, but continuing...")
+    except futures.TimeoutError:
+        print(
+            f"⚠️ Configuration test timed out after {CONFIG_TEST_TIMEOUT}s, "
+            "but continuing..."
+        )
     except Exception as e:
         print(f"⚠️ Could not test configuration: {e}")
-
-    # Get configuration from environment
-    check_interval = int(os.getenv("CHECK_INTERVAL", "300"))
-    ticket_url = os.getenv(
-        "TICKET_URL", "https://www.sportstiming.dk/event/6583/resale"
-    )
-    notify_all = os.getenv("NOTIFY_ALL", "true").lower() == "true"
-
-    print(f"🎯 Starting monitoring:")
-    print(f"   URL: {ticket_url}")
-    print(f"   Interval: {check_interval} seconds")
-    print(f"   Notify all statuses: {notify_all}")
+    finally:
+        executor.shutdown(wait=False)
+        # exec replaces the process without running atexit or logging
+        # shutdown, so flush the checker's buffered log records now
+        if checker is not None:
+            checker.close()
 
     # Build command
-    cmd = [
-        "python",
-        "ticket_checker.py",
-        "--config",
-        "config.json",
-        "--interval",
-        str(check_interval),
-        "--url",
-        ticket_url,
-    ]
-
-    if notify_all:
-        cmd.append("--notify-all")
+    cmd = build_monitor_command()
 
     # Start the application
     print("🏃 Starting application...")
+    sys.stdout.flush()
     os.execvp("python", cmd)
 
 
@@ -4,34 +4,43 @@ Helper script to extract cookies and generate environment variable commands
 Perfect for Railway deployment setup
 """
 
+import argparse
 import re
 import sys
 
 
+# Compiled once at import; the first matches the Cookie line anywhere in the
+# pasted headers, the second picks both auth cookies out of it in one scan
+_COOKIE_LINE_RE = re.compile(r"^[ \t]*cookie:.*$", re.IGNORECASE | re.MULTILINE)
+_AUTH_COOKIE_RE = re.compile(r"(st-auth-s2|st-sessionids2)=([^;]+)")
+
+
 def extract_cookies_from_headers(headers_text):
     """Extract cookies from browser headers text"""
-    cookie_line = None
-
-    for line in headers_text.split("\n"):
-        if line.strip().lower().startswith("cookie:"):
-            cookie_line = line.strip()
-            break
+    cookie_match = _COOKIE_LINE_RE.search(headers_text)
 
-    if not cookie_line:
+    if not cookie_match:
         return None, None
 
-    # Extract st-auth-s2 token
-    auth_match = re.search(r"st-auth-s2=([^;]+)", cookie_line)
-    auth_token = auth_match.group(1) if auth_match else None
+    cookie_line = cookie_match.group(0).strip()
 
-    # Extract st-sessionids2
-    session_match = re.search(r"st-sessionids2=([^;]+)", cookie_line)
-    session_id = session_match.group(1) if session_match else None
+    # Extract st-auth-s2 token and st-sessionids2 (first occurrence wins)
+    found = {}
+    for name, value in _AUTH_COOKIE_RE.findall(cookie_line):
+        found.setdefault(name, value)
 
-    return auth_token, session_id
+    return found.get("st-auth-s2"), found.get("st-sessionids2")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Railway environment setup helper")
+    parser.add_argument(
+        "--examples",
+        action="store_true",
+        help="Also print local testing commands and token expiration notes",
+    )
+    args = parser.parse_args()
+
     print("🚂 Railway Environment Setup Helper")
     print("=" * 40)
     print("This will help you set up environment variables for Railway deployment.")
@@ -88,6 +97,10 @@ def main():
         print(f"Variable Value: {session_id}")
         print()
 
+    if not args.examples:
+        print("💡 Run with --examples for local testing commands")
+        return
+
     print("🖥️  LOCAL TESTING COMMANDS:")
     print("=" * 30)
     print("For testing locally, run these commands:")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Shared startup helpers for the platform launchers (railway-start.py, heroku-start.py)
+Builds config.json from environment variables and the monitoring command line
+"""
+
+import os
+import json
+
+
+DEFAULT_TICKET_URL = "https://www.sportstiming.dk/event/6583/resale"
+
+
+def create_config_from_env():
+    """Create config.json from environment variables"""
+    env = os.environ
+    config = {}
+
+    # Telegram configuration
+    bot_token = env.get("TELEGRAM_BOT_TOKEN")
+    telegram_chat_id = env.get("TELEGRAM_CHAT_ID")
+    if bot_token and telegram_chat_id:
+        # Handle multiple chat IDs (comma-separated)
+        if "," in telegram_chat_id:
+            chat_ids = [id.strip() for id in telegram_chat_id.split(",")]
+        else:
+            chat_ids = telegram_chat_id.strip()
+
+        config["telegram"] = {
+            "bot_token": bot_token,
+            "chat_id": chat_ids,
+        }
+
+    # Email configuration (optional)
+    smtp_server = env.get("EMAIL_SMTP_SERVER")
+    email_username = env.get("EMAIL_USERNAME")
+    email_password = env.get("EMAIL_PASSWORD")
+    email_to = env.get("EMAIL_TO")
+    if all([smtp_server, email_username, email_password, email_to]):
+        config["email"] = {
+            "smtp_server": smtp_server,
+            "smtp_port": int(env.get("EMAIL_SMTP_PORT", "587")),
+            "username": email_username,
+            "password": email_password,
+            "from_email": env.get("EMAIL_FROM", email_username),
+            "to_email": email_to,
+        }
+
+    # SMS configuration (optional)
+    account_sid = env.get("TWILIO_ACCOUNT_SID")
+    twilio_auth_token = env.get("TWILIO_AUTH_TOKEN")
+    from_number = env.get("TWILIO_FROM_NUMBER")
+    to_number = env.get("TWILIO_TO_NUMBER")
+    if all([account_sid, twilio_auth_token, from_number, to_number]):
+        config["sms"] = {
+            "account_sid": account_sid,
+            "auth_token": twilio_auth_token,
+            "from_number": from_number,
+            "to_number": to_number,
+        }
+
+    # Pushover configuration (optional)
+    pushover_app_token = env.get("PUSHOVER_APP_TOKEN")
+    pushover_user_key = env.get("PUSHOVER_USER_KEY")
+    if pushover_app_token and pushover_user_key:
+        config["pushover"] = {
+            "app_token": pushover_app_token,
+            "user_key": pushover_user_key,
+        }
+
+    return config
+
+
+def write_config_if_changed(config, path="config.json"):
+    """
+    Write config to disk only if it differs from what is already there
+
+    Returns:
+        bool: True if the file was (re)written
+    """
+    try:
+        with open(path, "r") as f:
+            if json.load(f) == config:
+                return False
+    except (OSError, ValueError):
+        pass
+
+    # Machine-generated and only read back by ticket_checker.py, so write
+    # it as compact single-line JSON. Written to a temp file and renamed
+    # into place, so a crash mid-write never leaves a truncated config for
+    # the next boot to compare against
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(json.dumps(config, separators=(",", ":")))
+    os.replace(tmp_path, path)
+    return True
+
+
+def build_monitor_command(config_path="config.json"):
+    """
+    Build the ticket_checker.py command line from environment variables
+
+    Returns:
+        list: Command suitable for os.execvp
+    """
+    check_interval = int(os.getenv("CHECK_INTERVAL", "300"))
+    ticket_url = os.getenv("TICKET_URL", DEFAULT_TICKET_URL)
+    notify_all = os.getenv("NOTIFY_ALL", "true").lower() == "true"
+
+    print(f"🎯 Starting monitoring:")
+    print(f"   URL: {ticket_url}")
+    print(f"   Interval: {check_interval} seconds")
+    print(f"   Notify all statuses: {notify_all}")
+
+    cmd = [
+        "python",
+        "ticket_checker.py",
+        "--config",
+        config_path,
+        "--interval",
+        str(check_interval),
+        "--url",
+        ticket_url,
+    ]
+
+    if notify_all:
+        cmd.append("--notify-all")
+
+    return cmd
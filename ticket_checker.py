@@ -4,19 +4,293 @@ Sportstiming Ticket Checker Bot
 Automatically checks if tickets are available for sale on sportstiming.dk
 """
 
-import requests
-from bs4 import BeautifulSoup
 import time
 import logging
-from datetime import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import logging.handlers
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import argparse
+import functools
+import hashlib
 import json
 import os
+import queue
+import re
+import signal
 import sys
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, the json module is used otherwise
+    orjson = None
+
+
+# Cookies the site always expects; auth cookies are appended by update_cookies()
+_BASE_COOKIES = "cookies_allowed=required; st-lang=da-DK"
+
+# Enhanced headers to match browser request and bypass 403 errors
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    # Always decodable; __init__ extends it with br/zstd when urllib3 can
+    # decode them with the installed packages
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "sec-ch-ua": '"Chromium";v="136", "Google Chrome";v="136", "Not.A/Brand";v="99"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"macOS"',
+    # Session cookies - you may need to update these periodically
+    "Cookie": _BASE_COOKIES,
+}
+
+# Class name fragments that indicate a ticket listing element
+_TICKET_CLASS_PATTERNS = ("ticket-item", "ticket-listing", "billet-item", "sale-item")
+
+# Page text shown when nothing is for sale, matched against the raw response body
+_NO_TICKETS_PHRASES = (
+    "Der findes ingen billetter til salg",
+    "No tickets for sale exists",
+)
+_NO_TICKETS_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in _NO_TICKETS_PHRASES).encode()
+)
+_NO_TICKETS_MAX_LEN = max(len(phrase.encode()) for phrase in _NO_TICKETS_PHRASES)
+_NO_TICKETS_RESULT = ("NO_TICKETS", "No tickets available for sale", 0)
+
+# Ticket wording or price indicators that suggest listings, matched on the page
+# text. kr/dkk must be whole words, so "kr" inside longer words doesn't count;
+# "billet" only has to start a word, to also catch "billetter", "billetsalg"
+_TICKET_TEXT_RE = re.compile(r"(?i)\b(?:kr|dkk)\b|\bbillet")
+
+# Charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r"""charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+# Escapes Telegram Markdown special characters in a single pass
+_MARKDOWN_ESCAPE_TABLE = str.maketrans(
+    {char: f"\\{char}" for char in "_*[]()~`>#+-=|{}.!"}
+)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Longest single wait between retries of the event page, in seconds
+_MAX_RETRY_DELAY = 600
+
+# Socket timeout for SMTP, in seconds; same as the notification API requests,
+# so a stalled mail server can't hold up the notification worker
+_SMTP_TIMEOUT = 10
+
+# How long close() waits for queued notifications to go out, in seconds. Kept
+# well under the 10s Heroku and Docker allow between SIGTERM and SIGKILL
+_NOTIFY_SHUTDOWN_TIMEOUT = 5
+
+# Long-poll window for the Telegram command listener, and the pause before
+# polling again after a failed getUpdates call (both in seconds)
+_COMMAND_POLL_TIMEOUT = 50
+_COMMAND_RETRY_DELAY = 30
+
+# Upper bound on concurrent Telegram sends; stays under requests' default
+# pool size of 10 so every worker keeps its keep-alive connection
+_TELEGRAM_MAX_WORKERS = 8
+
+# Written by --create-config, one section per notification method
+_SAMPLE_CONFIG = {
+    "email": {
+        "smtp_server": "smtp.gmail.com",
+        "smtp_port": 587,
+        "username": "your_email@gmail.com",
+        "password": "your_app_password",
+        "from_email": "your_email@gmail.com",
+        "to_email": "notification_recipient@gmail.com",
+    },
+    "sms": {
+        "account_sid": "your_twilio_account_sid",
+        "auth_token": "your_twilio_auth_token",
+        "from_number": "+1234567890",
+        "to_number": "+1987654321",
+    },
+    "telegram": {
+        "bot_token": "your_bot_token_from_botfather",
+        "chat_id": "your_chat_id_or_channel_id",
+        "_note": 'For multiple people, use: "chat_id": ["123456789", "987654321"] or create a group/channel',
+    },
+    "pushover": {
+        "app_token": "your_pushover_app_token",
+        "user_key": "your_pushover_user_key",
+    },
+}
+
+
+# Printed after --create-config writes config.json
+_SAMPLE_CONFIG_GUIDE = """\
+Sample config.json created with all notification options.
+
+Telegram Setup Options:
+🔹 Option 1 - Single person:
+   "chat_id": "123456789"
+
+🔹 Option 2 - Multiple people:
+   "chat_id": ["123456789", "987654321", "555555555"]
+
+🔹 Option 3 - Group/Channel (recommended for multiple people):
+   1. Create a Telegram group
+   2. Add your bot to the group
+   3. Send a message in the group
+   4. Visit: https://api.telegram.org/bot<YOUR_BOT_TOKEN>/getUpdates
+   5. Use the group's chat ID (usually negative number)
+
+Setup instructions:
+1. Choose which notification method(s) you want to use
+2. Remove unused sections from config.json
+3. Fill in your credentials for the chosen method(s)
+4. Run --troubleshoot-telegram to verify setup
+"""
+
+# Printed by find_chat_ids when getUpdates has no chat messages
+_NO_CHATS_HELP = """\
+📭 No chat messages found in recent updates
+💡 Make sure to:
+   1. Add your bot to the group
+   2. Send a message in the group
+   3. Run this command again
+"""
+
+
+def _json_dumps(obj, indent=False):
+    """
+    Encode obj as UTF-8 JSON bytes, compact or indented by two spaces,
+    using orjson when installed
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_loads(data):
+    """Decode JSON from bytes or str, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _jitter(low, high):
+    """Random whole number of seconds between low and high, inclusive"""
+    return low + int(random.random() * (high - low + 1))
+
+
+def _parse_retry_after(value):
+    """
+    Seconds to wait according to a Retry-After header value, which is
+    either a number of seconds or an HTTP date; None if it can't be parsed
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _requests():
+    """
+    Import requests on first use rather than at module level, so
+    --create-config and --show-env start without loading it and urllib3
+
+    Returns:
+        module: The requests module
+    """
+    import requests
+
+    return requests
+
+
+@functools.lru_cache(maxsize=None)
+def _get_html_parser(encoding=None):
+    """
+    Build the shared lxml parser on first use so lxml is only imported
+    when a page actually has to be parsed
+
+    Args:
+        encoding (str): Charset declared by the server; None lets libxml2
+            detect it from the document
+
+    Returns:
+        lxml.html.HTMLParser: Parser for that encoding
+    """
+    import lxml.html
+
+    # Drop nodes that never carry ticket information while the tree is built
+    try:
+        return lxml.html.HTMLParser(
+            remove_blank_text=True,
+            remove_comments=True,
+            remove_pis=True,
+            encoding=encoding,
+        )
+    except LookupError:
+        # A charset libxml2 doesn't know; fall back to detection
+        return _get_html_parser()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_listing_xpaths():
+    """
+    Compile the XPath queries used by count_ticket_listings on first use,
+    so matching runs inside libxml2 instead of per element in Python
+
+    Returns:
+        tuple: (count of ticket-class elements, all tables, rows in a table)
+    """
+    from lxml import etree
+
+    class_test = " or ".join(
+        f"contains(@class, '{pattern}')" for pattern in _TICKET_CLASS_PATTERNS
+    )
+    return (
+        etree.XPath(f"count(//*[{class_test}])"),
+        etree.XPath("//table"),
+        etree.XPath("count(.//tr)"),
+    )
+
+
+def _private_chat_name(chat):
+    """Display name for a private chat: full name, falling back to username"""
+    name = f"{chat.get('first_name', '')} {chat.get('last_name', '')}".strip()
+    return name or chat.get("username", "Unknown User")
+
+
+def _group_chat_name(chat):
+    return chat.get("title", "Unknown Group")
+
+
+def _channel_chat_name(chat):
+    return chat.get("title", "Unknown Channel")
+
+
+# Chat type -> display name extractor, used when listing chats in find_chat_ids
+_CHAT_NAME_EXTRACTORS = {
+    "private": _private_chat_name,
+    "group": _group_chat_name,
+    "supergroup": _group_chat_name,
+    "channel": _channel_chat_name,
+}
 
 
 class SportstimingTicketChecker:
@@ -42,15 +316,27 @@ class SportstimingTicketChecker:
         self.check_interval = check_interval
         self.config_file = config_file
         self.config = self.load_config() if config_file else {}
+        self.load_telegram_settings()
+        # Sections read on every send, looked up once
+        self._smtp_cfg = self.config.get("email")
+        self._pushover_cfg = self.config.get("pushover")
         self.notify_all_statuses = notify_all_statuses
         self.dry_run = dry_run
 
-        # Set up logging
+        # Set up logging. File writes are buffered and flushed once per poll
+        # (or straight away for warnings and errors).
+        log_format = "%(asctime)s - %(levelname)s - %(message)s"
+        file_handler = logging.FileHandler("ticket_checker.log")
+        file_handler.setFormatter(logging.Formatter(log_format))
+        self._log_buffer = logging.handlers.MemoryHandler(
+            capacity=128, flushLevel=logging.WARNING, target=file_handler
+        )
+
         logging.basicConfig(
             level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
+            format=log_format,
             handlers=[
-                logging.FileHandler("ticket_checker.log"),
+                self._log_buffer,
                 logging.StreamHandler(
                     sys.stdout
                 ),  # Use stdout so Railway doesn't treat INFO as errors
@@ -58,27 +344,111 @@ class SportstimingTicketChecker:
         )
         self.logger = logging.getLogger(__name__)
 
-        # Enhanced headers to match browser request and bypass 403 errors
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "sec-ch-ua": '"Chromium";v="136", "Google Chrome";v="136", "Not.A/Brand";v="99"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"macOS"',
-            # Session cookies - you may need to update these periodically
-            "Cookie": "cookies_allowed=required; st-lang=da-DK",
-        }
+        requests = _requests()
+        from urllib3.util import Retry, make_headers
+
+        # Per-instance copy, since update_cookies() rewrites the Cookie header
+        self.headers = dict(_DEFAULT_HEADERS)
+        # Only advertise encodings urllib3 can decode with the installed
+        # packages (br needs brotli, zstd needs zstandard); a response we
+        # can't decompress would look like junk
+        self.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+            "accept-encoding"
+        ]
+
+        # One session for all HTTP calls so connections are kept alive and
+        # pooled across polls. Site headers/cookies are passed per request
+        # so they are never sent to the notification APIs.
+        self.session = requests.Session()
+        # Telegram gets its own pool, sized for the notification fan-out plus
+        # the command listener's long poll. GET calls (getMe, getUpdates) are
+        # retried on 429/5xx, honoring Retry-After; POSTs such as sendMessage
+        # are never resent, so a message can't be delivered twice. Read
+        # timeouts aren't retried either: a getUpdates long poll that timed
+        # out would otherwise block for the full poll window again
+        self.session.mount(
+            "https://api.telegram.org/",
+            requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_TELEGRAM_MAX_WORKERS + 1,
+                max_retries=Retry(
+                    total=3,
+                    read=0,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                ),
+            ),
+        )
+
+        # Logged-in SMTP connection and message envelope, created on first
+        # email and reused
+        self._smtp = None
+        self._email_msg = None
+
+        # Set by trigger_check() to cut the wait between checks short
+        self._wake = threading.Event()
+        # Set by stop() (e.g. on SIGTERM) to end the monitoring loop
+        self._stopping = threading.Event()
+
+        # Notifications raised while monitoring are sent from a background
+        # thread, so a slow SMTP server or API never delays the next check
+        self._notify_queue = None
+        self._notify_thread = None
+
+        # Highest Telegram update_id seen, for getUpdates offsets
+        self._last_update_id = 0
+
+        # Successful getMe/getChat results; these don't change while the
+        # process runs, so troubleshooting only asks Telegram once
+        self._telegram_info_cache = {}
+
+        # Validators and result of the last parsed page, for conditional GETs
+        self._conditional_headers = {}
+        self._last_result = None
+        # blake2b digest of the last parsed page body (None if it was sold out)
+        self._last_body_digest = None
+
+        # Set after the first page fetch has logged its Content-Encoding
+        self._encoding_logged = False
+
+        # Previous rate-limit backoff, the upper bound for the next jittered one
+        self._retry_delay = None
 
         # Automatically load authentication from environment variables
         self.load_auth_from_env()
 
+    def load_telegram_settings(self):
+        """
+        Validate the Telegram config and normalize chat_id to a list of
+        strings once, instead of on every notification
+        """
+        self._telegram_api = None
+        self._telegram_chat_ids = None
+        self._telegram_error = None
+
+        telegram_config = self.config.get("telegram")
+        if not telegram_config:
+            return
+
+        bot_token = telegram_config.get("bot_token")
+        chat_ids = telegram_config.get("chat_id")
+
+        if not bot_token:
+            self._telegram_error = "Telegram bot_token not found in config"
+        elif not chat_ids:
+            self._telegram_error = "Telegram chat_id not found in config"
+        # Support both single chat_id and multiple chat_ids
+        elif isinstance(chat_ids, (str, int)):
+            self._telegram_chat_ids = [str(chat_ids)]
+        elif isinstance(chat_ids, list):
+            self._telegram_chat_ids = [str(chat_id) for chat_id in chat_ids]
+        else:
+            self._telegram_error = "Telegram chat_id must be a string, number, or list"
+
+        if bot_token:
+            # Base URL for every Bot API call, built once per config load
+            self._telegram_api = f"https://api.telegram.org/bot{bot_token}/"
+
     def load_auth_from_env(self):
         """
         Load authentication tokens from environment variables
@@ -102,8 +472,8 @@ class SportstimingTicketChecker:
     def load_config(self):
         """Load configuration from JSON file"""
         if self.config_file and os.path.exists(self.config_file):
-            with open(self.config_file, "r") as f:
-                return json.load(f)
+            with open(self.config_file, "rb") as f:
+                return _json_loads(f.read())
         return {}
 
     def update_cookies(self, auth_token=None, session_id=None):
@@ -114,7 +484,7 @@ class SportstimingTicketChecker:
             auth_token (str): The st-auth-s2 JWT token from browser
             session_id (str): The st-sessionids2 session ID from browser
         """
-        base_cookies = "cookies_allowed=required; st-lang=da-DK"
+        base_cookies = _BASE_COOKIES
 
         if session_id:
             base_cookies += f"; st-sessionids2={session_id}"
@@ -125,6 +495,11 @@ class SportstimingTicketChecker:
         self.headers["Cookie"] = base_cookies
         self.logger.info("Updated authentication cookies")
 
+        # The page may look different once authenticated, so refetch it fully
+        self._conditional_headers = {}
+        self._last_result = None
+        self._last_body_digest = None
+
     def check_tickets_available(self):
         """
         Check if tickets are available for sale
@@ -136,28 +511,36 @@ class SportstimingTicketChecker:
         base_delay = 30  # Start with 30 seconds for 429 errors
 
         for attempt in range(max_retries + 1):
+            # One timestamp per attempt, shared by whichever result it produces
+            timestamp = datetime.now().isoformat()
+
             try:
-                # Create a session to maintain cookies
-                session = requests.Session()
-                session.headers.update(self.headers)
+                headers = self.headers
+                if self._conditional_headers:
+                    headers = {**self.headers, **self._conditional_headers}
 
-                response = session.get(self.event_url, timeout=30)
+                response = self.session.get(
+                    self.event_url, headers=headers, timeout=30, stream=True
+                )
 
                 # Handle 429 (Too Many Requests) specifically
                 if response.status_code == 429:
+                    response.close()
                     if attempt < max_retries:
-                        delay = base_delay * (
-                            2**attempt
-                        )  # Exponential backoff: 30s, 60s, 120s
+                        delay = self._rate_limit_delay(base_delay, response)
                         self.logger.warning(
-                            f"Rate limited (429). Waiting {delay} seconds before retry {attempt + 1}/{max_retries}"
+                            "Rate limited (429). Waiting %.0f seconds before retry %s/%s",
+                            delay,
+                            attempt + 1,
+                            max_retries,
                         )
-                        time.sleep(delay)
+                        if self._stopping.wait(delay):
+                            return self._stopped_result(timestamp)
                         continue
                     else:
                         self.logger.error("Rate limited (429) - max retries exceeded")
                         return {
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": timestamp,
                             "status": "RATE_LIMITED",
                             "message": "Rate limited by server (429). Try increasing check interval or wait longer.",
                             "ticket_count": 0,
@@ -166,34 +549,62 @@ class SportstimingTicketChecker:
 
                 # Handle 403 specifically
                 if response.status_code == 403:
+                    response.close()
                     self.logger.warning(
                         "Received 403 Forbidden - authentication may be required"
                     )
                     return {
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": timestamp,
                         "status": "AUTH_REQUIRED",
                         "message": "Authentication required (403 Forbidden). Please update cookies with --update-cookies command.",
                         "ticket_count": 0,
                         "url": self.event_url,
                     }
 
-                response.raise_for_status()
+                try:
+                    response.raise_for_status()
+                    content, sold_out = self._read_page(response)
+                finally:
+                    # Hands a fully read connection back to the pool and
+                    # drops one whose body wasn't read (error status, read
+                    # failure), so it never leaks
+                    response.close()
+                self._retry_delay = None
+
+                # Show once which compression the site actually uses
+                if not self._encoding_logged and response.status_code == 200:
+                    self._encoding_logged = True
+                    self.logger.info(
+                        "Event page Content-Encoding: %s (advertised: %s)",
+                        response.headers.get("Content-Encoding", "identity"),
+                        headers["Accept-Encoding"],
+                    )
                 break  # Success, exit retry loop
 
-            except requests.RequestException as e:
+            except _requests().RequestException as e:
                 if "429" in str(e) and attempt < max_retries:
-                    delay = base_delay * (2**attempt)
+                    delay = self._rate_limit_delay(
+                        base_delay, getattr(e, "response", None)
+                    )
                     self.logger.warning(
-                        f"Rate limited in exception. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}"
+                        "Rate limited in exception. Waiting %.0f seconds before retry %s/%s",
+                        delay,
+                        attempt + 1,
+                        max_retries,
                     )
-                    time.sleep(delay)
+                    if self._stopping.wait(delay):
+                        return self._stopped_result(timestamp)
                     continue
                 elif attempt < max_retries and "timeout" in str(e).lower():
                     delay = 10 * (attempt + 1)  # 10s, 20s, 30s for timeouts
                     self.logger.warning(
-                        f"Request timeout. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}"
+                        "Request timeout. Waiting %s seconds before retry %s/%s",
+                        delay,
+                        attempt + 1,
+                        max_retries,
                     )
-                    time.sleep(delay)
+                    if self._stopping.wait(delay):
+                        return self._stopped_result(timestamp)
                     continue
                 else:
                     error_msg = f"Failed to fetch page: {e}"
@@ -203,9 +614,9 @@ class SportstimingTicketChecker:
                         )
                     elif "429" in str(e):
                         error_msg += " - Rate limited. Increase check interval."
-                    self.logger.error(f"Request failed: {e}")
+                    self.logger.error("Request failed: %s", e)
                     return {
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": timestamp,
                         "status": "ERROR",
                         "message": error_msg,
                         "ticket_count": 0,
@@ -215,14 +626,18 @@ class SportstimingTicketChecker:
                 if attempt < max_retries:
                     delay = 10 * (attempt + 1)
                     self.logger.warning(
-                        f"Unexpected error. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}"
+                        "Unexpected error. Waiting %s seconds before retry %s/%s",
+                        delay,
+                        attempt + 1,
+                        max_retries,
                     )
-                    time.sleep(delay)
+                    if self._stopping.wait(delay):
+                        return self._stopped_result(timestamp)
                     continue
                 else:
-                    self.logger.error(f"Unexpected error: {e}")
+                    self.logger.error("Unexpected error: %s", e)
                     return {
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": timestamp,
                         "status": "ERROR",
                         "message": f"Unexpected error: {e}",
                         "ticket_count": 0,
@@ -230,96 +645,192 @@ class SportstimingTicketChecker:
                     }
 
         # If we get here, the request was successful
-        try:
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Look for the specific "sold out/reserved" message in Danish
-            # sold_out_message = "solgt eller reserveret. Hvis en anden kunde afbryder sit køb, kan reservationen muligvis frigives igen."
-
-            # Also check for the general "no tickets" message
-            no_tickets_text = "Der findes ingen billetter til salg"
-            no_tickets_text_en = "No tickets for sale exists"
-
-            page_text = soup.get_text()
+        if response.status_code == 304 and self._last_result:
+            self.logger.debug("Event page not modified since last check")
+            return dict(self._last_result, timestamp=timestamp)
 
-            # Check if tickets are sold out/reserved
-            # if sold_out_message in page_text:
-            #     status = "NO_TICKETS"
-            #     message = "All tickets are sold or reserved"
-            if no_tickets_text in page_text:
-                status = "NO_TICKETS"
-                message = "No tickets available for sale"
+        try:
+            if sold_out:
+                digest = None
+                status, message, ticket_count = _NO_TICKETS_RESULT
             else:
-                # If neither "sold out" message is present, tickets might be available
-                # Look for ticket listings or sale sections to confirm
-                ticket_sections = soup.find_all(
-                    ["div", "section"],
-                    string=lambda text: text and "billet" in text.lower(),
-                )
-
-                # Look for price indicators (DKK, kr, etc.)
-                price_indicators = soup.find_all(
-                    string=lambda text: text
-                    and ("kr" in text.lower() or "dkk" in text.lower())
-                )
-
-                if ticket_sections or price_indicators:
-                    status = "TICKETS_AVAILABLE"
-                    message = "🎫 Tickets are available! Check the website now!"
+                # A byte-identical page gets the same analysis, so reuse the
+                # previous result instead of parsing it again
+                digest = hashlib.blake2b(content, digest_size=16).digest()
+                if digest == self._last_body_digest and self._last_result:
+                    self.logger.debug("Event page unchanged since last check")
+                    status, message, ticket_count = (
+                        self._last_result["status"],
+                        self._last_result["message"],
+                        self._last_result["ticket_count"],
+                    )
                 else:
-                    status = "TICKETS_AVAILABLE"
-                    message = (
-                        "🎫 No 'sold out' message found - tickets may be available!"
+                    # Only a charset the server states explicitly; requests'
+                    # ISO-8859-1 fallback for text/* would garble UTF-8 pages
+                    charset = _CHARSET_RE.search(
+                        response.headers.get("Content-Type", "")
+                    )
+                    status, message, ticket_count = self.analyze_page(
+                        content, charset.group(1) if charset else None
                     )
-
-            # Count any visible ticket listings
-            ticket_count = self.count_ticket_listings(soup)
 
             result = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "status": status,
                 "message": message,
                 "ticket_count": ticket_count,
                 "url": self.event_url,
             }
 
+            # Remember the validators so the next poll can be a conditional GET
+            self._last_result = result
+            self._last_body_digest = digest
+            self._conditional_headers = {
+                request_header: response.headers[response_header]
+                for response_header, request_header in (
+                    ("ETag", "If-None-Match"),
+                    ("Last-Modified", "If-Modified-Since"),
+                )
+                if response_header in response.headers
+            }
+
             return result
 
         except Exception as e:
-            self.logger.error(f"Error parsing response: {e}")
+            self.logger.error("Error parsing response: %s", e)
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "status": "ERROR",
                 "message": f"Error parsing response: {e}",
                 "ticket_count": 0,
                 "url": self.event_url,
             }
 
-    def count_ticket_listings(self, soup):
+    def _stopped_result(self, timestamp):
+        """
+        Result for a check abandoned during a retry wait because stop() was
+        called; the monitoring loop exits on it without notifying
+        """
+        return {
+            "timestamp": timestamp,
+            "status": "STOPPED",
+            "message": "Check interrupted by shutdown",
+            "ticket_count": 0,
+            "url": self.event_url,
+        }
+
+    def _rate_limit_delay(self, base_delay, response=None):
+        """
+        How long to wait before retrying a rate-limited request
+
+        Honors the server's Retry-After header when present; otherwise uses
+        decorrelated jitter, a random delay between base_delay and three
+        times the previous one, so restarted instances don't retry in step
+
+        Args:
+            base_delay (int): Shortest delay in seconds
+            response: The 429 response, if one was received
+
+        Returns:
+            float: Delay in seconds
+        """
+        retry_after = None
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+        if retry_after is not None:
+            delay = min(retry_after, _MAX_RETRY_DELAY)
+        else:
+            previous = max(self._retry_delay or 0, base_delay)
+            delay = min(random.uniform(base_delay, previous * 3), _MAX_RETRY_DELAY)
+
+        self._retry_delay = delay
+        return delay
+
+    def _read_page(self, response):
+        """
+        Read a streamed event page, scanning for the "no tickets" message as
+        chunks arrive so a sold-out page is never buffered or parsed
+
+        Args:
+            response: Streamed response for the event page
+
+        Returns:
+            tuple: (content, sold_out) where content is None if sold out
+        """
+        overlap = _NO_TICKETS_MAX_LEN - 1
+        chunks = []
+        tail = b""
+
+        body = response.iter_content(chunk_size=8192)
+        for chunk in body:
+            window = tail + chunk
+            if _NO_TICKETS_RE.search(window):
+                # Stop the download here; the rest of the page isn't needed,
+                # and dropping one connection is cheaper than reading it
+                response.close()
+                return None, True
+
+            chunks.append(chunk)
+            tail = window[-overlap:]
+
+        return b"".join(chunks), False
+
+    def analyze_page(self, content, encoding=None):
+        """
+        Work out the ticket status of an event page that has no "no tickets"
+        message; check_tickets_available rules that out while the body
+        streams in (see _read_page), so it isn't searched for again here
+
+        Args:
+            content (bytes): Response body of the event page
+            encoding (str): Charset from the Content-Type header, if any;
+                passed to the parser so it doesn't have to detect one
+
+        Returns:
+            tuple: (status, message, ticket_count)
+        """
+        import lxml.html
+
+        tree = lxml.html.fromstring(content, parser=_get_html_parser(encoding))
+
+        # No "sold out" message is present, so tickets might be available.
+        # Look for ticket wording or price indicators (DKK, kr, etc.) in the
+        # page text, not the markup, to confirm. Each text node is checked on
+        # its own: text_content() glues adjacent cells together ("450kr")
+        if any(_TICKET_TEXT_RE.search(text) for text in tree.itertext()):
+            status = "TICKETS_AVAILABLE"
+            message = "🎫 Tickets are available! Check the website now!"
+        else:
+            status = "TICKETS_AVAILABLE"
+            message = "🎫 No 'sold out' message found - tickets may be available!"
+
+        # Count any visible ticket listings
+        ticket_count = self.count_ticket_listings(tree)
+
+        return status, message, ticket_count
+
+    def count_ticket_listings(self, tree):
         """
         Try to count actual ticket listings on the page
 
         Args:
-            soup: BeautifulSoup object of the page
+            tree: lxml.html element tree of the page
 
         Returns:
             int: Number of ticket listings found
         """
-        # Look for common patterns that might indicate ticket listings
-        ticket_patterns = ["ticket-item", "ticket-listing", "billet-item", "sale-item"]
+        count_ticket_classes, find_tables, count_rows = _get_listing_xpaths()
 
-        count = 0
-        for pattern in ticket_patterns:
-            elements = soup.find_all(class_=lambda x: x and pattern in x)
-            count += len(elements)
+        # Elements whose class looks like a ticket listing
+        count = int(count_ticket_classes(tree))
 
-        # Also look for table rows that might contain ticket data
-        tables = soup.find_all("table")
-        for table in tables:
-            rows = table.find_all("tr")
+        # Data rows of tables that might contain tickets
+        for table in find_tables(tree):
+            rows = int(count_rows(table))
             # Skip header row, count data rows
-            if len(rows) > 1:
-                count += len(rows) - 1
+            if rows > 1:
+                count += rows - 1
 
         return count
 
@@ -330,16 +841,26 @@ class SportstimingTicketChecker:
         Args:
             result (dict): Result from ticket check
         """
-        if not self.config.get("email"):
+        smtp_config = self._smtp_cfg
+        if not smtp_config:
             return
 
         try:
-            smtp_config = self.config["email"]
-
-            msg = MIMEMultipart()
-            msg["From"] = smtp_config["from_email"]
-            msg["To"] = smtp_config["to_email"]
-            msg["Subject"] = f"Sportstiming Ticket Alert - {result['status']}"
+            from email.mime.text import MIMEText
+            from email.mime.multipart import MIMEMultipart
+
+            # The envelope is built once; only the subject and body change
+            msg = self._email_msg
+            if msg is None:
+                msg = MIMEMultipart()
+                msg["From"] = smtp_config["from_email"]
+                msg["To"] = smtp_config["to_email"]
+                msg["Subject"] = ""
+                self._email_msg = msg
+
+            msg.replace_header(
+                "Subject", f"Sportstiming Ticket Alert - {result['status']}"
+            )
 
             body = f"""
 Ticket Check Results:
@@ -353,19 +874,90 @@ URL: {result['url']}
 This is an automated message from your Sportstiming ticket checker.
             """
 
-            msg.attach(MIMEText(body, "plain"))
+            msg.set_payload([MIMEText(body, "plain")])
 
-            server = smtplib.SMTP(smtp_config["smtp_server"], smtp_config["smtp_port"])
-            server.starttls()
-            server.login(smtp_config["username"], smtp_config["password"])
-            text = msg.as_string()
-            server.sendmail(smtp_config["from_email"], smtp_config["to_email"], text)
-            server.quit()
+            self._send_smtp_message(smtp_config, msg.as_string())
 
             self.logger.info("Email notification sent successfully")
 
         except Exception as e:
             self.logger.error(f"Failed to send email notification: {e}")
+            self._close_smtp_connection()
+
+    def _send_smtp_message(self, smtp_config, text):
+        """
+        Send a rendered message over the cached SMTP connection, reconnecting
+        once if the server dropped it since the last email
+
+        Args:
+            smtp_config (dict): The "email" section of the config
+            text (str): The message as a string
+        """
+        import smtplib
+
+        reused = self._smtp is not None
+        server = self._get_smtp_connection(smtp_config)
+        try:
+            server.sendmail(smtp_config["from_email"], smtp_config["to_email"], text)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException) as e:
+            # Idle connections get closed (or answered with 421) by the
+            # server; that only means the cached one went stale
+            stale = isinstance(e, smtplib.SMTPServerDisconnected) or e.smtp_code == 421
+            if not (reused and stale):
+                raise
+            self.logger.debug("SMTP connection went stale, reconnecting")
+            self._close_smtp_connection()
+            server = self._get_smtp_connection(smtp_config)
+            server.sendmail(smtp_config["from_email"], smtp_config["to_email"], text)
+
+    def _get_smtp_connection(self, smtp_config):
+        """
+        Return a logged-in SMTP connection, reusing the previous one if any
+
+        Args:
+            smtp_config (dict): The "email" section of the config
+        """
+        import smtplib
+
+        if self._smtp is not None:
+            return self._smtp
+
+        server = smtplib.SMTP(
+            smtp_config["smtp_server"], smtp_config["smtp_port"], timeout=_SMTP_TIMEOUT
+        )
+        server.starttls()
+        server.login(smtp_config["username"], smtp_config["password"])
+        self._smtp = server
+        return server
+
+    def _close_smtp_connection(self):
+        """Close the cached SMTP connection, if any"""
+        if self._smtp is None:
+            return
+
+        import smtplib
+
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
+
+    def close(self):
+        """
+        Finish sending queued notifications, release the pooled HTTP
+        connections and the SMTP connection, and write out any buffered
+        log records
+        """
+        if self._notify_thread is not None:
+            self._notify_queue.put(None)
+            self._notify_thread.join(_NOTIFY_SHUTDOWN_TIMEOUT)
+            if self._notify_thread.is_alive():
+                self.logger.warning("Gave up waiting for queued notifications")
+            self._notify_thread = None
+        self._close_smtp_connection()
+        self.session.close()
+        self._log_buffer.flush()
 
     def send_sms_notification(self, result):
         """
@@ -410,68 +1002,29 @@ Time: {result['timestamp'][:19]}"""
 
         Args:
             result (dict): Result from ticket check
+
+        Returns:
+            bool: True if every configured chat received the message
         """
         if not self.config.get("telegram"):
             self.logger.warning("Telegram configuration not found in config")
-            return
-
-        try:
-            telegram_config = self.config["telegram"]
-            bot_token = telegram_config.get("bot_token")
-            chat_ids = telegram_config.get("chat_id")
-
-            if not bot_token:
-                self.logger.error("Telegram bot_token not found in config")
-                return
+            return False
 
-            if not chat_ids:
-                self.logger.error("Telegram chat_id not found in config")
-                return
+        if self._telegram_error:
+            self.logger.error(self._telegram_error)
+            return False
 
-            # Support both single chat_id and multiple chat_ids
-            if isinstance(chat_ids, str) or isinstance(chat_ids, int):
-                chat_ids = [str(chat_ids)]
-            elif isinstance(chat_ids, list):
-                chat_ids = [str(chat_id) for chat_id in chat_ids]
-            else:
-                self.logger.error("Telegram chat_id must be a string, number, or list")
-                return
+        try:
+            chat_ids = self._telegram_chat_ids
 
             self.logger.info(
-                f"Sending Telegram notification to {len(chat_ids)} chat(s)"
+                "Sending Telegram notification to %s chat(s)", len(chat_ids)
             )
 
-            # Escape special characters for Markdown
-            def escape_markdown(text):
-                """Escape special characters for Telegram Markdown"""
-                special_chars = [
-                    "_",
-                    "*",
-                    "[",
-                    "]",
-                    "(",
-                    ")",
-                    "~",
-                    "`",
-                    ">",
-                    "#",
-                    "+",
-                    "-",
-                    "=",
-                    "|",
-                    "{",
-                    "}",
-                    ".",
-                    "!",
-                ]
-                for char in special_chars:
-                    text = text.replace(char, f"\\{char}")
-                return text
-
             # Create the message with proper escaping
-            status = escape_markdown(result["status"])
-            message = escape_markdown(result["message"])
-            timestamp = escape_markdown(result["timestamp"][:19])
+            status = result["status"].translate(_MARKDOWN_ESCAPE_TABLE)
+            message = result["message"].translate(_MARKDOWN_ESCAPE_TABLE)
+            timestamp = result["timestamp"][:19].translate(_MARKDOWN_ESCAPE_TABLE)
 
             message_text = f"""🎫 *Sportstiming Ticket Alert*
 
@@ -482,68 +1035,106 @@ Time: {result['timestamp'][:19]}"""
 
 [Check Website]({result['url']})"""
 
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-
-            success_count = 0
-            failed_chats = []
-
-            # Send to each chat ID
-            for chat_id in chat_ids:
-                try:
-                    payload = {
-                        "chat_id": chat_id,
-                        "text": message_text,
-                        "parse_mode": "Markdown",
-                        "disable_web_page_preview": False,
-                    }
-
-                    self.logger.debug(f"Sending to chat_id: {chat_id}")
-                    response = requests.post(url, json=payload, timeout=10)
-
-                    self.logger.debug(f"Response for {chat_id}: {response.status_code}")
-
-                    response.raise_for_status()
-                    response_data = response.json()
-
-                    if response_data.get("ok"):
-                        self.logger.info(
-                            f"✅ Message sent successfully to chat {chat_id}"
-                        )
-                        success_count += 1
-                    else:
-                        self.logger.error(
-                            f"❌ Telegram API error for chat {chat_id}: {response_data}"
-                        )
-                        failed_chats.append(chat_id)
+            url = f"{self._telegram_api}sendMessage"
+            # Everything but chat_id is the same for every recipient
+            base_payload = {
+                "text": message_text,
+                "parse_mode": "Markdown",
+                "disable_web_page_preview": False,
+            }
 
-                except requests.exceptions.RequestException as e:
-                    self.logger.error(
-                        f"❌ Network error sending to chat {chat_id}: {e}"
+            # Send to all chat IDs concurrently; each call is an independent
+            # round trip over the shared connection pool
+            workers = min(_TELEGRAM_MAX_WORKERS, len(chat_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sent = list(
+                    executor.map(
+                        lambda chat_id: self._send_telegram_message(
+                            url, chat_id, base_payload
+                        ),
+                        chat_ids,
                     )
-                    failed_chats.append(chat_id)
-                except Exception as e:
-                    self.logger.error(f"❌ Error sending to chat {chat_id}: {e}")
-                    failed_chats.append(chat_id)
+                )
+
+            success_count = sum(sent)
+            failed_chats = [
+                chat_id for chat_id, ok in zip(chat_ids, sent) if not ok
+            ]
 
             # Summary
             if success_count > 0:
                 self.logger.info(
-                    f"Telegram notifications sent successfully to {success_count}/{len(chat_ids)} chats"
+                    "Telegram notifications sent successfully to %s/%s chats",
+                    success_count,
+                    len(chat_ids),
                 )
 
             if failed_chats:
-                self.logger.warning(f"Failed to send to chats: {failed_chats}")
+                self.logger.warning("Failed to send to chats: %s", failed_chats)
 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Network error sending Telegram notification: {e}")
+            return not failed_chats
+
+        except _requests().RequestException as e:
+            self.logger.error("Network error sending Telegram notification: %s", e)
         except KeyError as e:
-            self.logger.error(f"Missing Telegram configuration key: {e}")
+            self.logger.error("Missing Telegram configuration key: %s", e)
+        except Exception as e:
+            self.logger.error("Failed to send Telegram notification: %s", e)
+        return False
+
+    def _send_telegram_message(self, url, chat_id, base_payload):
+        """
+        Send one Telegram message to a single chat
+
+        Args:
+            url (str): sendMessage endpoint
+            chat_id (str): Recipient chat
+            base_payload (dict): Message fields shared by all recipients
+
+        Returns:
+            bool: True if Telegram accepted the message
+        """
+        try:
+            # Copied per chat, since the sends run concurrently
+            payload = {"chat_id": chat_id, **base_payload}
+
+            self.logger.debug("Sending to chat_id: %s", chat_id)
+            response = self.session.post(
+                url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=10
+            )
+
+            self.logger.debug("Response for %s: %s", chat_id, response.status_code)
+
+            # The Bot API answers 200 only with {"ok": true}, so the body is
+            # decoded just on failure, for Telegram's error description
+            if response.status_code == 200:
+                self.logger.info("✅ Message sent successfully to chat %s", chat_id)
+                return True
+
+            try:
+                error = _json_loads(response.content).get("description")
+            except ValueError:
+                error = None
+            self.logger.error(
+                "❌ Telegram API error for chat %s: %s",
+                chat_id,
+                error or f"HTTP {response.status_code}",
+            )
+            return False
+
+        except _requests().RequestException as e:
+            self.logger.error("❌ Network error sending to chat %s: %s", chat_id, e)
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to send Telegram notification: {e}")
+            self.logger.error("❌ Error sending to chat %s: %s", chat_id, e)
+            return False
 
     def test_telegram_notification(self):
         """
         Test Telegram notification with a sample message
+
+        Returns:
+            bool: True if every configured chat received the test message
         """
         if not self.config.get("telegram"):
             self.logger.error(
@@ -560,8 +1151,7 @@ Time: {result['timestamp'][:19]}"""
         }
 
         self.logger.info("Sending test Telegram notification...")
-        self.send_telegram_notification(test_result)
-        return True
+        return self.send_telegram_notification(test_result)
 
     def test_all_notifications(self):
         """
@@ -575,8 +1165,26 @@ Time: {result['timestamp'][:19]}"""
             "url": self.event_url,
         }
 
+        senders = [
+            sender
+            for section, sender in (
+                ("email", self.send_email_notification),
+                ("sms", self.send_sms_notification),
+                ("telegram", self.send_telegram_notification),
+                ("pushover", self.send_pushover_notification),
+            )
+            if self.config.get(section)
+        ]
+        if not senders:
+            self.logger.warning("No notification methods configured")
+            return True
+
+        # Channels are independent, so test them side by side; the total wait
+        # is the slowest channel rather than the sum of all of them
         self.logger.info("Sending test notifications...")
-        self.send_notifications(test_result, force=True)
+        with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+            for sender in senders:
+                executor.submit(sender, test_result)
         return True
 
     def get_telegram_bot_info(self):
@@ -595,28 +1203,36 @@ Time: {result['timestamp'][:19]}"""
                 self.logger.error("Bot token not found in config")
                 return None
 
-            url = f"https://api.telegram.org/bot{bot_token}/getMe"
-            response = requests.get(url, timeout=10)
+            cache_key = (self._telegram_api, "getMe")
+            if cache_key in self._telegram_info_cache:
+                return self._telegram_info_cache[cache_key]
+
+            url = f"{self._telegram_api}getMe"
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            bot_info = response.json()
+            bot_info = _json_loads(response.content)
             if bot_info.get("ok"):
                 bot_data = bot_info["result"]
                 self.logger.info(
                     f"Bot info: {bot_data['first_name']} (@{bot_data.get('username', 'N/A')})"
                 )
+                self._telegram_info_cache[cache_key] = bot_data
                 return bot_data
             else:
-                self.logger.error(f"Failed to get bot info: {bot_info}")
+                self.logger.error("Failed to get bot info: %s", bot_info)
                 return None
 
         except Exception as e:
-            self.logger.error(f"Error getting bot info: {e}")
+            self.logger.error("Error getting bot info: %s", e)
             return None
 
-    def get_telegram_chat_info(self):
+    def get_telegram_chat_info(self, chat_id=None):
         """
         Get information about the Telegram chat to verify chat_id
+
+        Args:
+            chat_id (str): Chat to look up; defaults to the configured chat_id
         """
         if not self.config.get("telegram"):
             self.logger.error("Telegram configuration not found")
@@ -625,30 +1241,38 @@ Time: {result['timestamp'][:19]}"""
         try:
             telegram_config = self.config["telegram"]
             bot_token = telegram_config.get("bot_token")
-            chat_id = telegram_config.get("chat_id")
+            if chat_id is None:
+                chat_id = telegram_config.get("chat_id")
 
             if not bot_token or not chat_id:
                 self.logger.error("Bot token or chat_id not found in config")
                 return None
 
-            url = f"https://api.telegram.org/bot{bot_token}/getChat"
+            cache_key = (self._telegram_api, "getChat", str(chat_id))
+            if cache_key in self._telegram_info_cache:
+                return self._telegram_info_cache[cache_key]
+
+            url = f"{self._telegram_api}getChat"
             payload = {"chat_id": chat_id}
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.session.post(
+                url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=10
+            )
             response.raise_for_status()
 
-            chat_info = response.json()
+            chat_info = _json_loads(response.content)
             if chat_info.get("ok"):
                 chat_data = chat_info["result"]
                 self.logger.info(
                     f"Chat info: {chat_data.get('title', chat_data.get('first_name', 'Private chat'))}"
                 )
+                self._telegram_info_cache[cache_key] = chat_data
                 return chat_data
             else:
-                self.logger.error(f"Failed to get chat info: {chat_info}")
+                self.logger.error("Failed to get chat info: %s", chat_info)
                 return None
 
         except Exception as e:
-            self.logger.error(f"Error getting chat info: {e}")
+            self.logger.error("Error getting chat info: %s", e)
             return None
 
     def send_pushover_notification(self, result):
@@ -658,12 +1282,11 @@ Time: {result['timestamp'][:19]}"""
         Args:
             result (dict): Result from ticket check
         """
-        if not self.config.get("pushover"):
+        pushover_config = self._pushover_cfg
+        if not pushover_config:
             return
 
         try:
-            pushover_config = self.config["pushover"]
-
             payload = {
                 "token": pushover_config["app_token"],
                 "user": pushover_config["user_key"],
@@ -674,7 +1297,7 @@ Time: {result['timestamp'][:19]}"""
                 "priority": 1 if result["status"] == "TICKETS_AVAILABLE" else 0,
             }
 
-            response = requests.post(
+            response = self.session.post(
                 "https://api.pushover.net/1/messages.json", data=payload, timeout=10
             )
             response.raise_for_status()
@@ -724,34 +1347,172 @@ Time: {result['timestamp'][:19]}"""
         else:
             if dry_run:
                 self.logger.debug(
-                    f"🧪 DRY RUN - No notifications would be sent for status: {result['status']}"
+                    "🧪 DRY RUN - No notifications would be sent for status: %s",
+                    result["status"],
                 )
             else:
                 self.logger.debug(
-                    f"Not sending notifications for status: {result['status']}"
+                    "Not sending notifications for status: %s", result["status"]
                 )
 
+    def _start_notification_worker(self):
+        """Start the background thread that sends queued notifications"""
+        self._notify_queue = queue.Queue()
+        self._notify_thread = threading.Thread(
+            target=self._drain_notifications, name="notifications", daemon=True
+        )
+        self._notify_thread.start()
+
+    def _drain_notifications(self):
+        """Send queued notifications in order until a None sentinel arrives"""
+        while True:
+            item = self._notify_queue.get()
+            if item is None:
+                return
+            result, dry_run = item
+            try:
+                self.send_notifications(result, dry_run=dry_run)
+            except Exception as e:
+                self.logger.error("Error sending queued notifications: %s", e)
+
     def run_single_check(self):
         """Run a single check and return the result"""
         self.logger.info("Checking for available tickets...")
         result = self.check_tickets_available()
 
-        self.logger.info(f"Status: {result['status']} - {result['message']}")
+        self.logger.info("Status: %s - %s", result["status"], result["message"])
         if result["ticket_count"] > 0:
             self.logger.info(
-                f"Found {result['ticket_count']} potential ticket listings"
+                "Found %s potential ticket listings", result["ticket_count"]
             )
 
         # Note: Notifications are handled by the calling method (run_continuous_monitoring)
         # Only send notifications here if explicitly called from command line with --single
         return result
 
-    def run_continuous_monitoring(self):
-        """Run continuous monitoring with specified interval"""
+    def trigger_check(self):
+        """
+        Wake the monitoring loop so it checks right away instead of waiting
+        out the rest of the interval (safe to call from any thread)
+        """
+        self._wake.set()
+
+    def stop(self):
+        """
+        Ask the monitoring loop to exit after the current check, interrupting
+        the wait between checks (safe to call from any thread)
+        """
+        self._stopping.set()
+        self._wake.set()
+
+    def _handle_sigterm(self, signum, frame):
+        """SIGTERM handler: shut down cleanly instead of waiting for SIGKILL"""
+        self.logger.info("Received SIGTERM, stopping monitoring")
+        self.stop()
+
+    def _sleep_with_jitter(self, check_started, base_delay, low, high, minimum=0):
+        """
+        Wait until base_delay plus a random jitter has passed since the check
+        started, flushing the buffered log first
+
+        Args:
+            check_started (float): time.monotonic() when the check started
+            base_delay (int): Seconds between checks before jitter
+            low (int): Smallest jitter in seconds (may be negative)
+            high (int): Largest jitter in seconds
+            minimum (int): Lower bound for the jittered delay
+        """
+        jitter = _jitter(low, high)
+        delay = max(base_delay + jitter, minimum)
+        remaining = max(check_started + delay - time.monotonic(), 0)
+
+        self.logger.info("Next check in %.0f seconds (jitter %+ds)", remaining, jitter)
+        self._log_buffer.flush()
+        self._wait_for_next_check(remaining)
+
+    def _wait_for_next_check(self, delay):
+        """
+        Sleep until the next check is due or trigger_check() is called
+
+        Args:
+            delay (float): Seconds until the next scheduled check
+        """
+        if self._wake.wait(max(delay, 0)) and not self._stopping.is_set():
+            self.logger.info("Check triggered early")
+        self._wake.clear()
+
+    def _start_command_listener(self):
+        """Start the background thread that listens for Telegram commands"""
+        threading.Thread(
+            target=self._listen_for_commands, name="telegram-commands", daemon=True
+        ).start()
+        self.logger.info("👂 Listening for /check commands from configured chats")
+
+    def _listen_for_commands(self):
+        """
+        Long-poll Telegram for messages and trigger an immediate check when a
+        configured chat sends /check. The regular schedule stays the fallback
+        """
+        # Only react to commands sent from now on, not to the backlog. Until
+        # that call succeeds the offset is unknown, and polling would replay
+        # every old /check
+        while self.get_telegram_updates(offset=-1) is None:
+            if self._stopping.wait(_COMMAND_RETRY_DELAY):
+                return
+
+        while not self._stopping.is_set():
+            updates = self.get_telegram_updates(
+                offset=self._last_update_id + 1,
+                timeout=_COMMAND_POLL_TIMEOUT,
+                allowed_updates=["message"],
+            )
+            if updates is None:
+                # The failure is already logged; back off before retrying
+                self._stopping.wait(_COMMAND_RETRY_DELAY)
+                continue
+
+            for update in updates:
+                # One malformed update must not end the listener thread
+                try:
+                    self._handle_command_update(update)
+                except Exception as e:
+                    self.logger.error(
+                        "Error handling Telegram update %s: %s",
+                        update.get("update_id"),
+                        e,
+                    )
+
+    def _handle_command_update(self, update):
+        """
+        Trigger a check if the update is a /check message from a configured chat
+
+        Args:
+            update (dict): One update from getUpdates
+        """
+        message = update.get("message")
+        if not message:
+            return
+
+        # Accept both "/check" and "/check@BotName"
+        parts = (message.get("text") or "").split(maxsplit=1)
+        command = parts[0].split("@", 1)[0] if parts else ""
+        chat_id = str(message["chat"]["id"])
+        if command == "/check" and chat_id in self._telegram_chat_ids:
+            self.logger.info("📨 /check received from chat %s", chat_id)
+            self.trigger_check()
+
+    def run_continuous_monitoring(self, listen_for_commands=False):
+        """
+        Run continuous monitoring with specified interval
+
+        Args:
+            listen_for_commands (bool): Also long-poll Telegram so a /check
+                message from a configured chat starts a check right away
+        """
         self.logger.info(
-            f"Starting continuous monitoring every {self.check_interval} seconds"
+            "Starting continuous monitoring every %s seconds", self.check_interval
         )
-        self.logger.info(f"Monitoring URL: {self.event_url}")
+        self.logger.info("Monitoring URL: %s", self.event_url)
 
         if self.notify_all_statuses:
             self.logger.info("📢 Notifications enabled for ALL statuses")
@@ -766,16 +1527,45 @@ Time: {result['timestamp'][:19]}"""
         # Add rate limiting protection
         if self.check_interval < 60:
             self.logger.warning(
-                f"⚠️  Check interval ({self.check_interval}s) is quite frequent. Consider using 60s+ to avoid rate limiting."
+                "⚠️  Check interval (%ss) is quite frequent. Consider using 60s+ to avoid rate limiting.",
+                self.check_interval,
             )
 
+        # Open the connection to api.telegram.org up front with a getMe
+        # probe, so the TLS handshake isn't paid by the first real alert
+        if self._telegram_chat_ids and not self.dry_run:
+            if not self.get_telegram_bot_info():
+                self.logger.warning("⚠️  Telegram bot check failed at startup")
+
+        self._start_notification_worker()
+
+        if listen_for_commands:
+            if self._telegram_chat_ids:
+                self._start_command_listener()
+            else:
+                self.logger.warning(
+                    "⚠️  --listen-commands needs a valid Telegram configuration"
+                )
+
+        # Containers are stopped with SIGTERM; handle it like Ctrl+C so the
+        # wait between checks ends right away and queued notifications are
+        # still delivered. Signal handlers can only be set from the main thread
+        previous_sigterm = None
+        if threading.current_thread() is threading.main_thread():
+            previous_sigterm = signal.signal(signal.SIGTERM, self._handle_sigterm)
+
         last_status = None
         consecutive_same_status = 0  # Track how many times we've seen the same status
 
         try:
-            while True:
+            while not self._stopping.is_set():
+                # Intervals are measured from the start of each check on the
+                # monotonic clock, so time spent checking doesn't add drift
+                check_started = time.monotonic()
                 result = self.run_single_check()
                 current_status = result["status"]
+                if current_status == "STOPPED":
+                    break
 
                 # Track consecutive status occurrences
                 if current_status == last_status:
@@ -793,17 +1583,17 @@ Time: {result['timestamp'][:19]}"""
                         self.check_interval * 2, 300
                     )  # At least 5 minutes
                     self.logger.info(
-                        f"Using extended delay of {extended_delay} seconds due to rate limiting"
+                        "Using extended delay of %s seconds due to rate limiting",
+                        extended_delay,
                     )
 
-                    # Add random component to avoid synchronized requests
-                    jitter = random.randint(30, 120)  # 30-120 second random delay
-                    total_delay = extended_delay + jitter
-
-                    self.logger.info(
-                        f"Next check in {total_delay} seconds (extended + {jitter}s jitter)"
+                    # Add random component to avoid synchronized requests.
+                    # Measured from now rather than from check_started: the
+                    # check itself may have spent minutes in 429 backoff, and
+                    # that must not eat into the extended delay
+                    self._sleep_with_jitter(
+                        time.monotonic(), extended_delay, 30, 120
                     )
-                    time.sleep(total_delay)
                     continue
 
                 # Determine if we should send a notification
@@ -819,7 +1609,9 @@ Time: {result['timestamp'][:19]}"""
                         )
                     else:
                         self.logger.debug(
-                            f"Status unchanged: {current_status} (seen {consecutive_same_status} times)"
+                            "Status unchanged: %s (seen %s times)",
+                            current_status,
+                            consecutive_same_status,
                         )
                 else:
                     # Simple logic: Only notify for TICKETS_AVAILABLE if previous status was NOT TICKETS_AVAILABLE
@@ -833,36 +1625,43 @@ Time: {result['timestamp'][:19]}"""
                         )
                     else:
                         self.logger.debug(
-                            f"No notification needed: {current_status} (previous: {last_status})"
+                            "No notification needed: %s (previous: %s)",
+                            current_status,
+                            last_status,
                         )
 
                 # Send notification if needed
                 if should_send_notification:
                     self.logger.info(notification_reason)
-                    self.send_notifications(result, dry_run=self.dry_run)
+                    self._notify_queue.put((result, self.dry_run))
                     notification_type = "DRY RUN" if self.dry_run else "ACTUAL"
                     self.logger.info(
-                        f"📤 {notification_type} notification sent for status: {current_status}"
+                        "📤 %s notification queued for status: %s",
+                        notification_type,
+                        current_status,
                     )
                 else:
                     self.logger.debug(
-                        f"🔇 No notification sent - status: {current_status} (consecutive: {consecutive_same_status})"
+                        "🔇 No notification sent - status: %s (consecutive: %s)",
+                        current_status,
+                        consecutive_same_status,
                     )
 
                 last_status = current_status
 
-                # Add some jitter to prevent synchronized requests
-                base_interval = self.check_interval
-                jitter = random.randint(-30, 30)  # ±30 seconds random variation
-                actual_interval = max(base_interval + jitter, 30)  # Minimum 30 seconds
-
-                self.logger.info(f"Next check in {actual_interval} seconds...")
-                time.sleep(actual_interval)
+                # Add some jitter (±30s, minimum 30s) to prevent synchronized requests
+                self._sleep_with_jitter(
+                    check_started, self.check_interval, -30, 30, minimum=30
+                )
 
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user")
         except Exception as e:
-            self.logger.error(f"Monitoring error: {e}")
+            self.logger.error("Monitoring error: %s", e)
+        finally:
+            if previous_sigterm is not None:
+                signal.signal(signal.SIGTERM, previous_sigterm)
+            self.close()
 
     def troubleshoot_telegram(self):
         """
@@ -888,10 +1687,12 @@ Time: {result['timestamp'][:19]}"""
             print("   }")
             return False
 
+        # Read the settings once; every check below uses these locals
         telegram_config = self.config["telegram"]
+        bot_token = telegram_config.get("bot_token")
+        chat_id = telegram_config.get("chat_id")
 
         # Check bot token
-        bot_token = telegram_config.get("bot_token")
         if not bot_token:
             print("❌ Bot token not found in config")
             print("   Please add your bot token to the config file")
@@ -903,22 +1704,8 @@ Time: {result['timestamp'][:19]}"""
             print("   Please replace with your actual bot token from @BotFather")
             return False
 
-        print("✅ Bot token found in config")
-
-        # Test bot token
-        print("\n📡 Testing bot token...")
-        bot_info = self.get_telegram_bot_info()
-        if not bot_info:
-            print("❌ Bot token is invalid or bot is not accessible")
-            print("   Please check your bot token with @BotFather")
-            return False
-
-        print(
-            f"✅ Bot is valid: {bot_info['first_name']} (@{bot_info.get('username', 'N/A')})"
-        )
-
-        # Check chat ID
-        chat_id = telegram_config.get("chat_id")
+        # Check chat ID before the first network call, so an incomplete
+        # config is reported without waiting on the Telegram API
         if not chat_id:
             print("❌ Chat ID not found in config")
             print("   Please add your chat ID to the config file")
@@ -940,27 +1727,53 @@ Time: {result['timestamp'][:19]}"""
             print("   Please replace with your actual chat ID")
             return False
 
-        # Handle multiple chat IDs
-        if isinstance(chat_id, list):
-            print(f"✅ Found {len(chat_id)} chat IDs in config")
-            chat_ids_to_test = chat_id
+        # load_telegram_settings() already normalized chat_id to a list of
+        # strings (or recorded why it couldn't)
+        chat_ids_to_test = self._telegram_chat_ids
+        if not chat_ids_to_test:
+            print(f"❌ {self._telegram_error}")
+            return False
+
+        print("✅ Bot token found in config")
+
+        # Test bot token
+        print("\n📡 Testing bot token...")
+        bot_info = self.get_telegram_bot_info()
+        if not bot_info:
+            print("❌ Bot token is invalid or bot is not accessible")
+            print("   Please check your bot token with @BotFather")
+            return False
+
+        print(
+            f"✅ Bot is valid: {bot_info['first_name']} (@{bot_info.get('username', 'N/A')})"
+        )
+
+        if len(chat_ids_to_test) > 1:
+            print(f"✅ Found {len(chat_ids_to_test)} chat IDs in config")
         else:
             print("✅ Chat ID found in config")
-            chat_ids_to_test = [chat_id]
 
         # Test each chat ID
         print("\n📡 Testing chat access...")
         accessible_chats = []
         failed_chats = []
 
-        for idx, test_chat_id in enumerate(chat_ids_to_test):
-            print(f"   Testing chat {idx + 1}/{len(chat_ids_to_test)}: {test_chat_id}")
-
-            # Temporarily set single chat ID for testing
-            original_chat_id = telegram_config["chat_id"]
-            telegram_config["chat_id"] = test_chat_id
+        # Probe all chats at once; results are reported in config order
+        workers = min(_TELEGRAM_MAX_WORKERS, len(chat_ids_to_test))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chat_infos = list(
+                executor.map(
+                    lambda test_chat_id: self.get_telegram_chat_info(
+                        chat_id=test_chat_id
+                    ),
+                    chat_ids_to_test,
+                )
+            )
 
-            chat_info = self.get_telegram_chat_info()
+        for idx, (test_chat_id, chat_info) in enumerate(
+            zip(chat_ids_to_test, chat_infos)
+        ):
+            print(f"   Testing chat {idx + 1}/{len(chat_ids_to_test)}: {test_chat_id}")
 
             if chat_info:
                 chat_name = chat_info.get(
@@ -972,9 +1785,6 @@ Time: {result['timestamp'][:19]}"""
                 print(f"   ❌ Cannot access chat: {test_chat_id}")
                 failed_chats.append(test_chat_id)
 
-            # Restore original config
-            telegram_config["chat_id"] = original_chat_id
-
         if failed_chats:
             print(f"\n❌ Cannot access {len(failed_chats)} chat(s)")
             print("   Possible issues:")
@@ -1011,9 +1821,19 @@ Time: {result['timestamp'][:19]}"""
 
         return test_success
 
-    def get_telegram_updates(self):
+    def get_telegram_updates(self, offset=None, timeout=0, allowed_updates=None):
         """
         Get recent Telegram updates to help find chat IDs
+
+        Args:
+            offset (int): Only return updates from this update_id on; Telegram
+                treats all earlier updates as confirmed and drops them.
+                Defaults to just after the newest update already seen by
+                this checker, so repeated calls only fetch new updates
+            timeout (int): Long-polling timeout in seconds; Telegram holds the
+                request until an update arrives or the timeout expires
+            allowed_updates (list): Update types to return (e.g. ["message"]),
+                so Telegram filters the backlog before sending it
         """
         if not self.config.get("telegram"):
             self.logger.error("Telegram configuration not found")
@@ -1027,29 +1847,47 @@ Time: {result['timestamp'][:19]}"""
                 self.logger.error("Bot token not found in config")
                 return None
 
-            url = f"https://api.telegram.org/bot{bot_token}/getUpdates"
-            response = requests.get(url, timeout=10)
+            url = f"{self._telegram_api}getUpdates"
+            params = {"timeout": timeout}
+            if offset is None and self._last_update_id:
+                offset = self._last_update_id + 1
+            if offset is not None:
+                params["offset"] = offset
+            if allowed_updates is not None:
+                params["allowed_updates"] = _json_dumps(allowed_updates)
+
+            response = self.session.get(url, params=params, timeout=timeout + 10)
             response.raise_for_status()
 
-            updates = response.json()
+            updates = _json_loads(response.content)
             if updates.get("ok"):
-                return updates["result"]
+                result = updates["result"]
+                if result:
+                    self._last_update_id = max(
+                        self._last_update_id, result[-1]["update_id"]
+                    )
+                return result
             else:
-                self.logger.error(f"Failed to get updates: {updates}")
+                self.logger.error("Failed to get updates: %s", updates)
                 return None
 
         except Exception as e:
-            self.logger.error(f"Error getting updates: {e}")
+            self.logger.error("Error getting updates: %s", e)
             return None
 
     def find_chat_ids(self):
         """
         Find and display all chat IDs from recent messages
+
+        Returns:
+            list: (chat_id, name) tuples, newest chat first, or None if
+            nothing was found
         """
         print("🔍 Finding Chat IDs from Recent Messages")
         print("=" * 45)
 
-        updates = self.get_telegram_updates()
+        # Only plain messages carry the chat info used below
+        updates = self.get_telegram_updates(allowed_updates=["message"])
         if not updates:
             print("❌ Could not get updates from Telegram")
             return
@@ -1059,126 +1897,113 @@ Time: {result['timestamp'][:19]}"""
             print("💡 Send a message to your bot or in your group, then try again")
             return
 
-        found_chats = {}
-
-        for update in updates:
-            if "message" in update:
-                message = update["message"]
-                chat = message["chat"]
-                chat_id = chat["id"]
-                chat_type = chat["type"]
-
-                # Get chat name/title
-                if chat_type == "private":
-                    name = f"{chat.get('first_name', '')} {chat.get('last_name', '')}".strip()
-                    if not name:
-                        name = chat.get("username", "Unknown User")
-                elif chat_type in ["group", "supergroup"]:
-                    name = chat.get("title", "Unknown Group")
-                elif chat_type == "channel":
-                    name = chat.get("title", "Unknown Channel")
-                else:
-                    name = f"Unknown ({chat_type})"
-
-                found_chats[chat_id] = {
-                    "name": name,
-                    "type": chat_type,
-                    "message_text": (
-                        message.get("text", "")[:50] + "..."
-                        if len(message.get("text", "")) > 50
-                        else message.get("text", "")
-                    ),
-                    "from_user": message.get("from", {}).get("first_name", "Unknown"),
-                }
-
-        if not found_chats:
-            print("📭 No chat messages found in recent updates")
-            print("💡 Make sure to:")
-            print("   1. Add your bot to the group")
-            print("   2. Send a message in the group")
-            print("   3. Run this command again")
+        seen = set()
+        # (chat_id, name) per chat, kept only for the copy-paste block
+        summary = []
+
+        # Walk newest first so each chat is reported once, from its latest
+        # message, and printed as soon as it is found
+        for update in reversed(updates):
+            # Pull only the fields needed below; skip non-message updates
+            message = update.get("message")
+            if not message:
+                continue
+
+            chat = message["chat"]
+            chat_id = chat["id"]
+            if chat_id in seen:
+                continue
+            seen.add(chat_id)
+
+            chat_type = chat["type"]
+
+            # Get chat name/title
+            extract_name = _CHAT_NAME_EXTRACTORS.get(chat_type)
+            name = extract_name(chat) if extract_name else f"Unknown ({chat_type})"
+
+            if not summary:
+                print("📬 Chats with recent messages (newest first):\n")
+            summary.append((chat_id, name))
+
+            from_user = message.get("from", {}).get("first_name", "Unknown")
+            lines = [
+                f"💬 Chat ID: {chat_id}",
+                f"   📛 Name: {name}",
+                f"   🏷️  Type: {chat_type}",
+                f"   👤 Last message from: {from_user}",
+            ]
+            text = message.get("text")
+            if text:
+                preview = f"{text[:50]}..." if len(text) > 50 else text
+                lines.append(f'   💭 Last message: "{preview}"')
+            lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
+
+        if not summary:
+            sys.stdout.write(_NO_CHATS_HELP)
             return
 
-        print(f"📬 Found {len(found_chats)} chat(s) with recent messages:\n")
-
-        for chat_id, info in found_chats.items():
-            print(f"💬 Chat ID: {chat_id}")
-            print(f"   📛 Name: {info['name']}")
-            print(f"   🏷️  Type: {info['type']}")
-            print(f"   👤 Last message from: {info['from_user']}")
-            if info["message_text"]:
-                print(f"   💭 Last message: \"{info['message_text']}\"")
-            print()
-
         # Provide copy-paste ready config
-        if len(found_chats) == 1:
-            chat_id = list(found_chats.keys())[0]
-            print("📋 Copy this to your config.json:")
-            print(f'   "chat_id": "{chat_id}"')
+        lines = [f"📬 Found {len(summary)} chat(s) with recent messages"]
+        if len(summary) == 1:
+            chat_id = summary[0][0]
+            lines.append("📋 Copy this to your config.json:")
+            lines.append(f'   "chat_id": "{chat_id}"')
         else:
-            all_ids = list(found_chats.keys())
-            print("📋 Copy this to your config.json:")
-            print("   For a single chat:")
-            for chat_id in all_ids:
-                print(f'     "chat_id": "{chat_id}"  # {found_chats[chat_id]["name"]}')
-            print("\n   For all chats:")
-            ids_str = ", ".join([f'"{chat_id}"' for chat_id in all_ids])
-            print(f'     "chat_id": [{ids_str}]')
+            lines.append("📋 Copy this to your config.json:")
+            lines.append("   For a single chat:")
+            for chat_id, name in summary:
+                lines.append(f'     "chat_id": "{chat_id}"  # {name}')
+            lines.append("\n   For all chats:")
+            ids_str = ", ".join([f'"{chat_id}"' for chat_id, _ in summary])
+            lines.append(f'     "chat_id": [{ids_str}]')
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        return found_chats
+        return summary
 
 
 def create_sample_config():
     """Create a sample configuration file with all notification options"""
-    config = {
-        "email": {
-            "smtp_server": "smtp.gmail.com",
-            "smtp_port": 587,
-            "username": "your_email@gmail.com",
-            "password": "your_app_password",
-            "from_email": "your_email@gmail.com",
-            "to_email": "notification_recipient@gmail.com",
-        },
-        "sms": {
-            "account_sid": "your_twilio_account_sid",
-            "auth_token": "your_twilio_auth_token",
-            "from_number": "+1234567890",
-            "to_number": "+1987654321",
-        },
-        "telegram": {
-            "bot_token": "your_bot_token_from_botfather",
-            "chat_id": "your_chat_id_or_channel_id",
-            "_note": 'For multiple people, use: "chat_id": ["123456789", "987654321"] or create a group/channel',
-        },
-        "pushover": {
-            "app_token": "your_pushover_app_token",
-            "user_key": "your_pushover_user_key",
-        },
-    }
-
-    with open("config.json", "w") as f:
-        json.dump(config, f, indent=2)
-
-    print("Sample config.json created with all notification options.")
-    print("\nTelegram Setup Options:")
-    print("🔹 Option 1 - Single person:")
-    print('   "chat_id": "123456789"')
-    print("\n🔹 Option 2 - Multiple people:")
-    print('   "chat_id": ["123456789", "987654321", "555555555"]')
-    print("\n🔹 Option 3 - Group/Channel (recommended for multiple people):")
-    print("   1. Create a Telegram group")
-    print("   2. Add your bot to the group")
-    print("   3. Send a message in the group")
-    print("   4. Visit: https://api.telegram.org/bot<YOUR_BOT_TOKEN>/getUpdates")
-    print("   5. Use the group's chat ID (usually negative number)")
-    print("\nSetup instructions:")
-    print("1. Choose which notification method(s) you want to use")
-    print("2. Remove unused sections from config.json")
-    print("3. Fill in your credentials for the chosen method(s)")
-    print("4. Run --troubleshoot-telegram to verify setup")
+    with open("config.json", "wb") as f:
+        f.write(_json_dumps(_SAMPLE_CONFIG, indent=True))
 
+    sys.stdout.write(_SAMPLE_CONFIG_GUIDE)
 
-def main():
+
+def show_env_status():
+    """Print which authentication environment variables are set"""
+    print("🔍 Environment Variables Status")
+    print("=" * 35)
+
+    auth_token = os.getenv("ST_AUTH_TOKEN")
+    session_id = os.getenv("ST_SESSION_ID")
+
+    if auth_token:
+        print(f"✅ ST_AUTH_TOKEN: {auth_token[:30]}...")
+        print(f"   Length: {len(auth_token)} characters")
+    else:
+        print("❌ ST_AUTH_TOKEN: Not set")
+
+    if session_id:
+        print(f"✅ ST_SESSION_ID: {session_id}")
+    else:
+        print("❌ ST_SESSION_ID: Not set")
+
+    if not auth_token and not session_id:
+        print("\n💡 To set environment variables:")
+        print("   export ST_AUTH_TOKEN='your_token_here'")
+        print("   export ST_SESSION_ID='your_session_id_here'")
+        print("\n📖 See RAILWAY_SETUP.md for detailed instructions")
+    else:
+        print(
+            f"\n🎯 Authentication: {'✅ Ready' if (auth_token and session_id) else '⚠️ Partial'}"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the command line parser once and reuse it for later main() calls"""
     parser = argparse.ArgumentParser(description="Sportstiming Ticket Checker Bot")
     parser.add_argument(
         "--url",
@@ -1258,7 +2083,26 @@ def main():
         action="store_true",
         help="Run monitoring without sending actual notifications (for testing)",
     )
+    parser.add_argument(
+        "--listen-commands",
+        action="store_true",
+        help="While monitoring, check immediately when a configured Telegram chat sends /check",
+    )
+
+    return parser
 
+
+def main():
+    # Fast path for one-shot commands that need neither the full parser
+    # nor a checker instance
+    if sys.argv[1:] == ["--create-config"]:
+        create_sample_config()
+        return
+    if sys.argv[1:] == ["--show-env"]:
+        show_env_status()
+        return
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.create_config:
@@ -1266,33 +2110,7 @@ def main():
         return
 
     if args.show_env:
-        print("🔍 Environment Variables Status")
-        print("=" * 35)
-
-        auth_token = os.getenv("ST_AUTH_TOKEN")
-        session_id = os.getenv("ST_SESSION_ID")
-
-        if auth_token:
-            print(f"✅ ST_AUTH_TOKEN: {auth_token[:30]}...")
-            print(f"   Length: {len(auth_token)} characters")
-        else:
-            print("❌ ST_AUTH_TOKEN: Not set")
-
-        if session_id:
-            print(f"✅ ST_SESSION_ID: {session_id}")
-        else:
-            print("❌ ST_SESSION_ID: Not set")
-
-        if not auth_token and not session_id:
-            print("\n💡 To set environment variables:")
-            print("   export ST_AUTH_TOKEN='your_token_here'")
-            print("   export ST_SESSION_ID='your_session_id_here'")
-            print("\n📖 See RAILWAY_SETUP.md for detailed instructions")
-        else:
-            print(
-                f"\n🎯 Authentication: {'✅ Ready' if (auth_token and session_id) else '⚠️ Partial'}"
-            )
-
+        show_env_status()
         return
 
     # Set debug logging if requested
@@ -1307,6 +2125,22 @@ def main():
         dry_run=args.dry_run,
     )
 
+    # close() writes out the buffered file log, which nothing else does for
+    # one-shot commands (or when a launcher exec()s after us)
+    try:
+        _run_command(checker, args)
+    finally:
+        checker.close()
+
+
+def _run_command(checker, args):
+    """
+    Run the action selected on the command line
+
+    Args:
+        checker (SportstimingTicketChecker): Configured checker
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Handle cookie updates
     if args.auth_token or args.session_id:
         # Command-line arguments override environment variables
@@ -1322,7 +2156,7 @@ def main():
             # Send notifications for single checks if tickets are available
             if result["status"] == "TICKETS_AVAILABLE":
                 checker.send_notifications(result, dry_run=checker.dry_run)
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result, indent=True).decode())
             return
 
     # Check if environment variables are set
@@ -1366,7 +2200,7 @@ def main():
             # Send notifications for single checks if tickets are available
             if result["status"] == "TICKETS_AVAILABLE":
                 checker.send_notifications(result, dry_run=checker.dry_run)
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result, indent=True).decode())
         else:
             print("❌ No cookies provided")
         return
@@ -1408,8 +2242,8 @@ def main():
         if found_chats:
             print("\n🎉 Chat IDs found successfully!")
             print("📋 Copy these to your config.json:")
-            for chat_id, info in found_chats.items():
-                print(f'   "chat_id": "{chat_id}"  # {info["name"]}')
+            for chat_id, name in found_chats:
+                print(f'   "chat_id": "{chat_id}"  # {name}')
         else:
             print("\n📭 No chat IDs found")
         return
@@ -1419,9 +2253,9 @@ def main():
         # Send notifications for single checks if tickets are available
         if result["status"] == "TICKETS_AVAILABLE":
             checker.send_notifications(result, dry_run=checker.dry_run)
-        print(json.dumps(result, indent=2))
+        print(_json_dumps(result, indent=True).decode())
     else:
-        checker.run_continuous_monitoring()
+        checker.run_continuous_monitoring(listen_for_commands=args.listen_commands)
 
 
 if __name__ == "__main__":
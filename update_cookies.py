@@ -4,10 +4,31 @@ Helper script to extract cookies from browser headers
 Run this when you get 403 errors to update authentication
 """
 
-import re
 import sys
 
 
+def iter_cookie_pairs(cookie_header):
+    """
+    Yield (name, value) pairs from a Cookie header value
+
+    Scans the string once with str.find instead of splitting it into
+    intermediate lists.
+    """
+    pos = 0
+    length = len(cookie_header)
+
+    while pos < length:
+        sep = cookie_header.find(";", pos)
+        if sep == -1:
+            sep = length
+
+        eq = cookie_header.find("=", pos, sep)
+        if eq != -1:
+            yield cookie_header[pos:eq].strip(), cookie_header[eq + 1 : sep].strip()
+
+        pos = sep + 1
+
+
 def extract_cookies_from_headers(headers_text):
     """Extract cookies from browser headers text"""
     cookie_line = None
@@ -21,13 +42,19 @@ def extract_cookies_from_headers(headers_text):
         print("❌ No Cookie header found in the provided text")
         return None, None
 
-    # Extract st-auth-s2 token
-    auth_match = re.search(r"st-auth-s2=([^;]+)", cookie_line)
-    auth_token = auth_match.group(1) if auth_match else None
-
-    # Extract st-sessionids2
-    session_match = re.search(r"st-sessionids2=([^;]+)", cookie_line)
-    session_id = session_match.group(1) if session_match else None
+    auth_token = None
+    session_id = None
+
+    # Single pass over the "name=value; name=value" pairs
+    for name, value in iter_cookie_pairs(cookie_line[len("cookie:") :]):
+        if name == "st-auth-s2":
+            auth_token = value
+        elif name == "st-sessionids2":
+            session_id = value
+        else:
+            continue
+        if auth_token and session_id:
+            break
 
     return auth_token, session_id
 